@@ -14,8 +14,9 @@ import random
 from tdw.controller import Controller
 from tdw.tdw_utils import TDWUtils
 from tdw.output_data import OutputData, SegmentationColors, Meshes
-from tdw.librarian import ModelRecord, MaterialLibrarian
+from tdw.librarian import ModelRecord
 
+from tdw_physics.util import MATERIAL_TYPES, MATERIAL_NAMES
 from tdw_physics.postprocessing.stimuli import pngs_to_mp4
 from tdw_physics.postprocessing.labels import (get_labels_from,
                                                get_all_label_funcs,
@@ -24,15 +25,19 @@ from tdw_physics.util_geom import save_obj
 import shutil
 
 PASSES = ["_img", "_depth", "_normals", "_flow", "_id"]
-M = MaterialLibrarian()
-MATERIAL_TYPES = M.get_material_types()
-MATERIAL_NAMES = {mtype: [m.name for m in M.get_all_materials_of_type(mtype)] \
-                  for mtype in MATERIAL_TYPES}
+
+# frozen copies for O(1) material lookups in get_material_name
+MATERIAL_TYPES_SET = frozenset(MATERIAL_TYPES)
+MATERIAL_NAME_SETS = {mtype: frozenset(names) for mtype, names in MATERIAL_NAMES.items()}
 
 # colors for the target/zone overlay
 ZONE_COLOR = [255,255,0]
 TARGET_COLOR = [255,0,0]
 
+# shared "no commands this frame" return value for get_per_frame_commands;
+# callers only iterate it, so one list can be reused across frames
+EMPTY_COMMANDS: List[dict] = []
+
 class Dataset(Controller, ABC):
     """
     Abstract class for a physics dataset.
@@ -574,11 +579,12 @@ class Dataset(Controller, ABC):
 
         # stimulus name
         static_group.create_dataset("stimulus_name", data=self.stimulus_name)
-        static_group.create_dataset("object_ids", data=self.object_ids)
-        static_group.create_dataset("model_names", data=[s.encode('utf8') for s in self.model_names])
+        static_group.create_dataset("object_ids", data=self.object_ids, compression="gzip")
+        static_group.create_dataset("model_names", data=[s.encode('utf8') for s in self.model_names], compression="gzip")
 
         if self.object_segmentation_colors is not None:
-            static_group.create_dataset("object_segmentation_colors", data=self.object_segmentation_colors)
+            static_group.create_dataset("object_segmentation_colors", data=self.object_segmentation_colors,
+                                        compression="gzip")
 
     @abstractmethod
     def _write_frame(self, frames_grp: h5py.Group, resp: List[bytes], frame_num: int) -> \
@@ -680,10 +686,10 @@ class Dataset(Controller, ABC):
     def get_material_name(self, material):
 
         if material is not None:
-            if material in MATERIAL_TYPES:
+            if material in MATERIAL_TYPES_SET:
                 mat = random.choice(MATERIAL_NAMES[material])
             else:
-                assert any((material in MATERIAL_NAMES[mtype] for mtype in self.material_types)), \
+                assert any((material in MATERIAL_NAME_SETS[mtype] for mtype in self.material_types)), \
                     (material, self.material_types)
                 mat = material
         else:
@@ -54,11 +54,10 @@ def compute_metadata_from_stimuli(
     # iterate over stims
     metadata = []
     for stimpath in stims:
-        f = h5py.File(stimpath, 'r')
-        trial_meta = OrderedDict()
-        trial_meta = get_labels_from(f, label_funcs, res=trial_meta)
+        with h5py.File(stimpath, 'r') as f:
+            trial_meta = OrderedDict()
+            trial_meta = get_labels_from(f, label_funcs, res=trial_meta)
         metadata.append(trial_meta)
-        f.close()
 
     # write out new metadata
     json_str = json.dumps(metadata, indent=4)    
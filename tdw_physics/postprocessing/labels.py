@@ -333,15 +333,16 @@ def get_across_trial_stats_from(paths, funcs, agg_func=avg_label):
 
     res = []
     for i,path in enumerate(tqdm(paths)):
-        f = h5py.File(path)
         res_f = OrderedDict()
-        for func in funcs:
-            try:
-                res_f[func.__name__ + '/' + agg_func.__name__] = func(f)
-            except Exception as e:
-                print("Error occured during trials stats collection:",e)
+        # read-only open; the context manager closes the file even if a
+        # label func raises, so a bad trial can't leak an open handle
+        with h5py.File(path, 'r') as f:
+            for func in funcs:
+                try:
+                    res_f[func.__name__ + '/' + agg_func.__name__] = func(f)
+                except Exception as e:
+                    print("Error occured during trials stats collection:",e)
         res.append(res_f)
-        f.close()
 
     try:
         keys = res[0].keys()
@@ -1,3 +1,5 @@
+import copy
+import functools
 import random
 from typing import List, Tuple, Dict, Optional
 from abc import ABC
@@ -13,16 +15,28 @@ from tdw_physics.transforms_dataset import TransformsDataset
 from tdw_physics.util import MODEL_LIBRARIES, str_to_xyz, xyz_to_arr, arr_to_xyz
 
 
+@functools.lru_cache(maxsize=None)
+def _parse_random_transform_string(s: str):
+    """
+    Parse a transform argument string once per distinct value; the same
+    defaults (e.g. "[0,0]", "0.0,0.8,0.0") are re-parsed by every controller
+    in a chained parser, so cache the json/eval work per process.
+    """
+    try:
+        return json.loads(s)
+    except:
+        try: return eval(s) #this allows us to read dictionaries etc.
+        except: return str_to_xyz(s)
+
+
 def handle_random_transform_args(args):
 
     if args is not None:
         if type(args) in [float,int,bool]: # don't apply any parsing to simple datatypes
             return args
-        try:
-            args = json.loads(args)
-        except:
-            try: args = eval(args) #this allows us to read dictionaries etc.
-            except: args = str_to_xyz(args)
+        if isinstance(args, str):
+            # hand back a copy so callers can mutate the parsed value freely
+            args = copy.deepcopy(_parse_random_transform_string(args))
 
         if hasattr(args, 'keys'):
             if 'class' in args:
@@ -521,17 +535,17 @@ class RigidbodiesDataset(TransformsDataset, ABC):
         super()._write_static_data(static_group)
 
         ## physical
-        static_group.create_dataset("mass", data=self.masses)
-        static_group.create_dataset("static_friction", data=self.static_frictions)
-        static_group.create_dataset("dynamic_friction", data=self.dynamic_frictions)
-        static_group.create_dataset("bounciness", data=self.bouncinesses)
+        static_group.create_dataset("mass", data=self.masses, compression="gzip")
+        static_group.create_dataset("static_friction", data=self.static_frictions, compression="gzip")
+        static_group.create_dataset("dynamic_friction", data=self.dynamic_frictions, compression="gzip")
+        static_group.create_dataset("bounciness", data=self.bouncinesses, compression="gzip")
 
         ## size and colors
-        static_group.create_dataset("color", data=self.colors)
-        static_group.create_dataset("scale", data=np.stack([xyz_to_arr(_s) for _s in self.scales], 0))
-        static_group.create_dataset("scale_x", data=[_s["x"] for _s in self.scales])
-        static_group.create_dataset("scale_y", data=[_s["y"] for _s in self.scales])
-        static_group.create_dataset("scale_z", data=[_s["z"] for _s in self.scales])
+        static_group.create_dataset("color", data=self.colors, compression="gzip")
+        static_group.create_dataset("scale", data=np.stack([xyz_to_arr(_s) for _s in self.scales], 0), compression="gzip")
+        static_group.create_dataset("scale_x", data=[_s["x"] for _s in self.scales], compression="gzip")
+        static_group.create_dataset("scale_y", data=[_s["y"] for _s in self.scales], compression="gzip")
+        static_group.create_dataset("scale_z", data=[_s["z"] for _s in self.scales], compression="gzip")
 
         if self.save_meshes:
             mesh_group = static_group.create_group("mesh")
@@ -539,8 +553,8 @@ class RigidbodiesDataset(TransformsDataset, ABC):
             obj_points = []
             for idx, object_id in enumerate(self.object_ids):
                 vertices, faces = self.object_meshes[object_id]
-                mesh_group.create_dataset(f"faces_{idx}", data=faces)
-                mesh_group.create_dataset(f"vertices_{idx}", data=vertices)
+                mesh_group.create_dataset(f"faces_{idx}", data=faces, compression="gzip")
+                mesh_group.create_dataset(f"vertices_{idx}", data=vertices, compression="gzip")
 
     def _write_frame(self, frames_grp: h5py.Group, resp: List[bytes], frame_num: int) -> \
             Tuple[h5py.Group, h5py.Group, dict, bool]:
@@ -549,14 +563,15 @@ class RigidbodiesDataset(TransformsDataset, ABC):
         # Physics data.
         velocities = np.empty(dtype=np.float32, shape=(num_objects, 3))
         angular_velocities = np.empty(dtype=np.float32, shape=(num_objects, 3))
-        # Collision data.
-        collision_ids = np.empty(dtype=np.int32, shape=(0, 2))
-        collision_relative_velocities = np.empty(dtype=np.float32, shape=(0, 3))
-        collision_contacts = np.empty(dtype=np.float32, shape=(0, 2, 3))
-        collision_states = np.empty(dtype=str, shape=(0, 1))
+        # Collision data, accumulated in lists and converted to arrays once
+        # at write time (np.append copies the whole array on every call).
+        collision_ids = []
+        collision_relative_velocities = []
+        collision_contacts = []
+        collision_states = []
         # Environment Collision data.
-        env_collision_ids = np.empty(dtype=np.int32, shape=(0, 1))
-        env_collision_contacts = np.empty(dtype=np.float32, shape=(0, 2, 3))
+        env_collision_ids = []
+        env_collision_contacts = []
 
         sleeping = True
 
@@ -586,29 +601,37 @@ class RigidbodiesDataset(TransformsDataset, ABC):
                         print([OutputData.get_data_type_id(r) for r in resp])
             elif r_id == "coll":
                 co = Collision(r)
-                collision_states = np.append(collision_states, co.get_state())
-                collision_ids = np.append(collision_ids, [co.get_collider_id(), co.get_collidee_id()])
-                collision_relative_velocities = np.append(collision_relative_velocities, co.get_relative_velocity())
+                collision_states.append(co.get_state())
+                collision_ids.append([co.get_collider_id(), co.get_collidee_id()])
+                collision_relative_velocities.append(co.get_relative_velocity())
                 for i in range(co.get_num_contacts()):
-                    collision_contacts = np.append(collision_contacts, (co.get_contact_normal(i),
-                                                                        co.get_contact_point(i)))
+                    collision_contacts.append((co.get_contact_normal(i),
+                                               co.get_contact_point(i)))
             elif r_id == "enco":
                 en = EnvironmentCollision(r)
-                env_collision_ids = np.append(env_collision_ids, en.get_object_id())
+                env_collision_ids.append(en.get_object_id())
                 for i in range(en.get_num_contacts()):
-                    env_collision_contacts = np.append(env_collision_contacts, (en.get_contact_normal(i),
-                                                                                en.get_contact_point(i)))
+                    env_collision_contacts.append((en.get_contact_normal(i),
+                                                   en.get_contact_point(i)))
         objs.create_dataset("velocities", data=velocities.reshape(num_objects, 3), compression="gzip")
         objs.create_dataset("angular_velocities", data=angular_velocities.reshape(num_objects, 3), compression="gzip")
         collisions = frame.create_group("collisions")
-        collisions.create_dataset("object_ids", data=collision_ids.reshape((-1, 2)), compression="gzip")
-        collisions.create_dataset("relative_velocities", data=collision_relative_velocities.reshape((-1, 3)),
+        collisions.create_dataset("object_ids",
+                                  data=np.array(collision_ids, dtype=np.int32).reshape((-1, 2)),
                                   compression="gzip")
-        collisions.create_dataset("contacts", data=collision_contacts.reshape((-1, 2, 3)), compression="gzip")
-        collisions.create_dataset("states", data=collision_states.astype('S'), compression="gzip")
+        collisions.create_dataset("relative_velocities",
+                                  data=np.array(collision_relative_velocities, dtype=np.float32).reshape((-1, 3)),
+                                  compression="gzip")
+        collisions.create_dataset("contacts",
+                                  data=np.array(collision_contacts, dtype=np.float32).reshape((-1, 2, 3)),
+                                  compression="gzip")
+        collisions.create_dataset("states", data=np.array(collision_states).astype('S'), compression="gzip")
         env_collisions = frame.create_group("env_collisions")
-        env_collisions.create_dataset("object_ids", data=env_collision_ids, compression="gzip")
-        env_collisions.create_dataset("contacts", data=env_collision_contacts.reshape((-1, 2, 3)),
+        env_collisions.create_dataset("object_ids",
+                                      data=np.array(env_collision_ids, dtype=np.int32),
+                                      compression="gzip")
+        env_collisions.create_dataset("contacts",
+                                      data=np.array(env_collision_contacts, dtype=np.float32).reshape((-1, 2, 3)),
                                       compression="gzip")
         return frame, objs, tr, sleeping
 
@@ -9,22 +9,18 @@ import random
 from typing import List, Dict, Tuple
 from weighted_collection import WeightedCollection
 from tdw.tdw_utils import TDWUtils
-from tdw.librarian import ModelRecord, MaterialLibrarian
+from tdw.librarian import ModelRecord
 from tdw.output_data import OutputData, Transforms
 from tdw_physics.rigidbodies_dataset import (RigidbodiesDataset,
                                              get_random_xyz_transform,
                                              get_range,
                                              handle_random_transform_args)
-from tdw_physics.util import MODEL_LIBRARIES, get_parser, xyz_to_arr, arr_to_xyz, str_to_xyz
+from tdw_physics.util import MODEL_LIBRARIES, get_model_names, get_parser, xyz_to_arr, arr_to_xyz, str_to_xyz, MATERIAL_TYPES, MATERIAL_NAMES
 
 from tdw_physics.target_controllers.dominoes import Dominoes, MultiDominoes, get_args
 from tdw_physics.postprocessing.labels import is_trial_valid
 
-MODEL_NAMES = [r.name for r in MODEL_LIBRARIES['models_flex.json'].records]
-M = MaterialLibrarian()
-MATERIAL_TYPES = M.get_material_types()
-MATERIAL_NAMES = {mtype: [m.name for m in M.get_all_materials_of_type(mtype)] \
-                  for mtype in MATERIAL_TYPES}
+MODEL_NAMES = list(get_model_names('models_flex.json'))
 
 def none_or_str(value):
     if value == 'None':
@@ -89,7 +85,7 @@ class Barrier(MultiDominoes):
     def _build_bridge(self):
         return []
 
-    def clear_static_data(self) --> None:
+    def clear_static_data(self) -> None:
         Dominoes.clear_static_data(self)
 
         # clear some other stuff
@@ -117,13 +113,13 @@ if __name__ == "__main__":
         bridge_height=args.bridge_height
     )
 
-    if bool(args.run):
+    if args.run:
         BC.run(num=args.num,
                output_dir=args.dir,
                temp_path=args.temp,
                width=args.width,
                height=args.height,
-               save_passes=args.save_passes.split(','),
+               save_passes=args.save_passes,
                save_movies=args.save_movies,
                save_labels=args.save_labels,               
                args_dict=vars(args)
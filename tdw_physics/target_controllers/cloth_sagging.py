@@ -11,14 +11,14 @@ from tdw.tdw_utils import TDWUtils
 from tdw_physics.target_controllers.dominoes import Dominoes, get_args, ArgumentParser
 from tdw_physics.flex_dataset import FlexDataset, FlexParticles
 from tdw_physics.rigidbodies_dataset import RigidbodiesDataset
-from tdw_physics.util import MODEL_LIBRARIES, get_parser, none_or_str
+from tdw_physics.util import MODEL_LIBRARIES, get_model_names, get_parser, none_or_str, launch_controller, set_gpu_display
 
 from tdw_physics.postprocessing.labels import get_all_label_funcs
 
 # fluid
 from tdw.flex.fluid_types import FluidTypes
 
-MODEL_NAMES = [r.name for r in MODEL_LIBRARIES['models_flex.json'].records]
+MODEL_NAMES = list(get_model_names('models_flex.json'))
 MODEL_CORE = [r.name for r in MODEL_LIBRARIES['models_core.json'].records]
 
 def get_flex_args(dataset_dir: str, parse=True):
@@ -553,16 +553,10 @@ class ClothSagging(Dominoes, FlexDataset):
         self.distractor_max_size = 1.2
 
 if __name__ == '__main__':
-    import platform, os
 
     args = get_flex_args("flex_dominoes")
 
-    import platform
-    if platform.system() == 'Linux':
-        if args.gpu is not None:
-            os.environ["DISPLAY"] = ":0." + str(args.gpu)
-        else:
-            os.environ["DISPLAY"] = ":0"
+    set_gpu_display(args.gpu)
 
     C = ClothSagging(
         port=args.port,
@@ -604,8 +598,8 @@ if __name__ == '__main__':
         middle_rotation_range=args.mrot,
         middle_mass_range=args.mmass,
         horizontal=args.horizontal,
-        remove_target=bool(args.remove_target),
-        remove_zone=bool(args.remove_zone),
+        remove_target=args.remove_target,
+        remove_zone=args.remove_zone,
         ## not scenario-specific
         camera_radius=args.camera_distance,
         camera_min_angle=args.camera_min_angle,
@@ -625,7 +619,7 @@ if __name__ == '__main__':
         num_occluders=args.num_occluders,
         occlusion_scale=args.occlusion_scale,
         remove_middle=args.remove_middle,
-        use_ramp=bool(args.ramp),
+        use_ramp=args.ramp,
         ramp_color=args.rcolor,
         flex_only=args.only_use_flex_objects,
         no_moving_distractors=args.no_moving_distractors,
@@ -640,18 +634,4 @@ if __name__ == '__main__':
         use_test_mode_colors=args.use_test_mode_colors
     )
 
-    if bool(args.run):
-        C.run(num=args.num,
-             output_dir=args.dir,
-             temp_path=args.temp,
-             width=args.width,
-             height=args.height,
-             write_passes=args.write_passes.split(','),
-             save_passes=args.save_passes.split(','),
-             save_movies=args.save_movies,
-             save_labels=args.save_labels,
-              save_meshes=args.save_meshes,
-             args_dict=vars(args))
-    else:
-        end = C.communicate({"$type": "terminate"})
-        print([OutputData.get_data_type_id(r) for r in end])
+    launch_controller(C, args)
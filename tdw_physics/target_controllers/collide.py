@@ -13,11 +13,11 @@ from tdw.librarian import ModelRecord, MaterialLibrarian, SceneLibrarian, _Libra
 from tdw_physics.rigidbodies_dataset import (RigidbodiesDataset,
                                              get_random_xyz_transform,
                                              handle_random_transform_args)
-from tdw_physics.util import MODEL_LIBRARIES, get_parser, xyz_to_arr, arr_to_xyz, str_to_xyz
+from tdw_physics.util import MODEL_LIBRARIES, get_model_names, get_parser, xyz_to_arr, arr_to_xyz, str_to_xyz
 
 from tdw_physics.target_controllers.dominoes import Dominoes, MultiDominoes, get_args
 
-MODEL_NAMES = [r.name for r in MODEL_LIBRARIES['models_flex.json'].records]
+MODEL_NAMES = list(get_model_names('models_flex.json'))
 
 def get_collide_args(dataset_dir: str, parse=True):
     """
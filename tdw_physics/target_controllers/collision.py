@@ -9,22 +9,18 @@ import random
 from typing import List, Dict, Tuple
 from weighted_collection import WeightedCollection
 from tdw.tdw_utils import TDWUtils
-from tdw.librarian import ModelRecord, MaterialLibrarian
+from tdw.librarian import ModelRecord
 from tdw.output_data import OutputData, Transforms
 from tdw_physics.rigidbodies_dataset import (RigidbodiesDataset,
                                              get_random_xyz_transform,
                                              get_range,
                                              handle_random_transform_args)
-from tdw_physics.util import MODEL_LIBRARIES, get_parser, xyz_to_arr, arr_to_xyz, str_to_xyz
+from tdw_physics.util import MODEL_LIBRARIES, get_model_names, get_parser, xyz_to_arr, arr_to_xyz, str_to_xyz, launch_controller, set_gpu_display, MATERIAL_TYPES, MATERIAL_NAMES
 
 from tdw_physics.target_controllers.dominoes import Dominoes, MultiDominoes, get_args, none_or_str, none_or_int
 from tdw_physics.postprocessing.labels import is_trial_valid
 
-MODEL_NAMES = [r.name for r in MODEL_LIBRARIES['models_flex.json'].records]
-M = MaterialLibrarian()
-MATERIAL_TYPES = M.get_material_types()
-MATERIAL_NAMES = {mtype: [m.name for m in M.get_all_materials_of_type(mtype)] \
-                  for mtype in MATERIAL_TYPES}
+MODEL_NAMES = list(get_model_names('models_flex.json'))
 
 OCCLUDER_CATS = "coffee table,houseplant,vase,chair,dog,sofa,flowerpot,coffee maker,stool,laptop,laptop computer,globe,bookshelf,desktop computer,garden plant,garden plant,garden plant"
 DISTRACTOR_CATS = "coffee table,houseplant,vase,chair,dog,sofa,flowerpot,coffee maker,stool,laptop,laptop computer,globe,bookshelf,desktop computer,garden plant,garden plant,garden plant"
@@ -158,6 +154,8 @@ def get_collision_args(dataset_dir: str, parse=True):
 
 class Collision(Dominoes):
 
+    MAX_FRAMES = 150 # End after this many frames even if objects are still moving.
+
     def __init__(self,
                  port: int = None,
                  zjitter = 0,
@@ -382,9 +380,6 @@ class Collision(Dominoes):
 
         return funcs
     
-    def is_done(self, resp: List[bytes], frame: int) -> bool:
-        return frame > 150 # End after X frames even if objects are still moving.
-
     def _set_distractor_attributes(self) -> None:
 
         self.distractor_angular_spacing = 20
@@ -406,15 +401,10 @@ class Collision(Dominoes):
     
 
 if __name__ == "__main__":
-    import platform, os
     
     args = get_collision_args("collision")
     
-    if platform.system() == 'Linux':
-        if args.gpu is not None:
-            os.environ["DISPLAY"] = ":0." + str(args.gpu)
-        else:
-            os.environ["DISPLAY"] = ":0"
+    set_gpu_display(args.gpu)
 
     ColC = Collision(
         port=args.port,
@@ -442,8 +432,8 @@ if __name__ == "__main__":
         force_offset=args.foffset,
         force_offset_jitter=args.fjitter,
         force_wait=args.fwait,
-        remove_target=bool(args.remove_target),
-        remove_zone=bool(args.remove_zone),
+        remove_target=args.remove_target,
+        remove_zone=args.remove_zone,
         zjitter = args.zjitter,
         fupforce = args.fupforce,
         ## not scenario-specific
@@ -472,19 +462,4 @@ if __name__ == "__main__":
         use_test_mode_colors=args.use_test_mode_colors        
     )
 
-    if bool(args.run):
-        ColC.run(num=args.num,
-                 output_dir=args.dir,
-                 temp_path=args.temp,
-                 width=args.width,
-                 height=args.height,
-                 framerate=args.framerate,
-                 save_passes=args.save_passes.split(','),
-                 save_movies=args.save_movies,
-                 save_labels=args.save_labels,
-                 save_meshes=args.save_meshes,
-                 write_passes=args.write_passes,
-                 args_dict=vars(args)
-        )
-    else:
-        ColC.communicate({"$type": "terminate"})
+    launch_controller(ColC, args)
@@ -3,6 +3,7 @@ import sys
 import h5py
 import json
 import copy
+import functools
 import importlib
 import numpy as np
 from enum import Enum
@@ -17,16 +18,19 @@ from tdw_physics.rigidbodies_dataset import (RigidbodiesDataset,
                                              get_random_xyz_transform,
                                              get_range,
                                              handle_random_transform_args)
-from tdw_physics.util import (MODEL_LIBRARIES, FLEX_MODELS, MODEL_CATEGORIES,
+from tdw_physics.dataset import EMPTY_COMMANDS
+from tdw_physics.util import (launch_controller, set_gpu_display,
+                              MODEL_LIBRARIES, FLEX_MODELS, MODEL_CATEGORIES,
                               MATERIAL_TYPES, MATERIAL_NAMES,
+                              get_model_names,
                               get_parser,
                               xyz_to_arr, arr_to_xyz, str_to_xyz,
                               none_or_str, none_or_int, int_or_bool)
 
 from tdw_physics.postprocessing.labels import get_all_label_funcs
 
-PRIMITIVE_NAMES = [r.name for r in MODEL_LIBRARIES['models_flex.json'].records if not r.do_not_use]
-FULL_NAMES = [r.name for r in MODEL_LIBRARIES['models_full.json'].records if not r.do_not_use]
+PRIMITIVE_NAMES = list(get_model_names('models_flex.json', exclude_do_not_use=True))
+FULL_NAMES = list(get_model_names('models_full.json', exclude_do_not_use=True))
 
 def get_args(dataset_dir: str, parse=True):
     """
@@ -275,8 +279,8 @@ def get_args(dataset_dir: str, parse=True):
     # which models are allowed
     parser.add_argument("--model_libraries",
                         type=none_or_str,
-                        default=','.join(list(MODEL_LIBRARIES.keys())),
-                        help="Which model libraries can be drawn from")
+                        default=None,
+                        help="Which model libraries can be drawn from; defaults to all of them")
     parser.add_argument("--only_use_flex_objects",
                         action="store_true",
                         help="Only use models that are FLEX models (and have readable meshes)")
@@ -300,14 +304,25 @@ def get_args(dataset_dir: str, parse=True):
         # testing set data drew from a different set of models; needs to be preserved
         # for correct occluder/distractor sampling
         if not (args.training_data_mode or args.readout_data_mode):
-            PRIMITIVE_NAMES = [r.name for r in MODEL_LIBRARIES['models_flex.json'].records]
-            FULL_NAMES = [r.name for r in MODEL_LIBRARIES['models_full.json'].records]
+            PRIMITIVE_NAMES = list(get_model_names('models_flex.json'))
+            FULL_NAMES = list(get_model_names('models_full.json'))
+        else:
+            # same values as the module-level lists; bound here so the
+            # references below never hit an unassigned local
+            PRIMITIVE_NAMES = list(get_model_names('models_flex.json', exclude_do_not_use=True))
+            FULL_NAMES = list(get_model_names('models_full.json', exclude_do_not_use=True))
+
+        # set for O(1) membership checks on the comma-separated object lists
+        PRIMITIVE_NAMES_SET = frozenset(PRIMITIVE_NAMES)
 
         # choose a valid room
         assert args.room in ['box', 'tdw', 'house'], args.room
 
-        # parse the model libraries
-        if args.model_libraries is not None:
+        # parse the model libraries; the default (None) defers to the full
+        # set of libraries so argparse never carries the joined string around
+        if args.model_libraries is None:
+            args.model_libraries = list(MODEL_LIBRARIES.keys())
+        else:
             if not isinstance(args.model_libraries, list):
                 args.model_libraries = args.model_libraries.split(',')
             libs = []
@@ -321,6 +336,12 @@ def get_args(dataset_dir: str, parse=True):
         # whether to set all objects same color
         args.monochrome = bool(args.monochrome)
 
+        # coerce the int flags to bools once, so call sites can use them directly
+        args.run = bool(args.run)
+        args.remove_target = bool(args.remove_target)
+        args.remove_zone = bool(args.remove_zone)
+        args.ramp = bool(args.ramp)
+
         # camera distance
         args.camera_distance = handle_random_transform_args(args.camera_distance)
 
@@ -351,7 +372,7 @@ def get_args(dataset_dir: str, parse=True):
 
         if args.zone is not None:
             zone_list = args.zone.split(',')
-            assert all([t in PRIMITIVE_NAMES for t in zone_list]), \
+            assert all([t in PRIMITIVE_NAMES_SET for t in zone_list]), \
                 "All target object names must be elements of %s" % PRIMITIVE_NAMES
             args.zone = zone_list
         else:
@@ -359,7 +380,7 @@ def get_args(dataset_dir: str, parse=True):
 
         if args.target is not None:
             targ_list = args.target.split(',')
-            assert all([t in PRIMITIVE_NAMES for t in targ_list]), \
+            assert all([t in PRIMITIVE_NAMES_SET for t in targ_list]), \
                 "All target object names must be elements of %s" % PRIMITIVE_NAMES
             args.target = targ_list
         else:
@@ -367,7 +388,7 @@ def get_args(dataset_dir: str, parse=True):
 
         if args.probe is not None:
             probe_list = args.probe.split(',')
-            assert all([t in PRIMITIVE_NAMES for t in probe_list]), \
+            assert all([t in PRIMITIVE_NAMES_SET for t in probe_list]), \
                 "All target object names must be elements of %s" % PRIMITIVE_NAMES
             args.probe = probe_list
         else:
@@ -499,6 +520,13 @@ def get_args(dataset_dir: str, parse=True):
         else:
             args.use_test_mode_colors = False
 
+        # split the pass specs once here rather than at every call site, so
+        # vars(args) captures the canonical list form
+        if isinstance(args.write_passes, str):
+            args.write_passes = args.write_passes.split(',')
+        if isinstance(args.save_passes, str):
+            args.save_passes = args.save_passes.split(',')
+
         return args
 
     if not parse:
@@ -515,6 +543,10 @@ class Dominoes(RigidbodiesDataset):
     """
 
     MAX_TRIALS = 1000
+    # trials end once the frame count passes MAX_FRAMES; structures are not
+    # considered stable (sleeping) before MIN_FRAMES
+    MAX_FRAMES = 300
+    MIN_FRAMES = 150
     DEFAULT_RAMPS = [r for r in MODEL_LIBRARIES['models_full.json'].records if 'ramp_with_platform_30' in r.name]
     CUBE = [r for r in MODEL_LIBRARIES['models_flex.json'].records if 'cube' in r.name][0]
     PRINT = False
@@ -705,14 +737,22 @@ class Dominoes(RigidbodiesDataset):
 
         if isinstance(objlist, str):
             objlist = [objlist]
-        recs = []
-        for lib in libraries:
-            recs.extend(MODEL_LIBRARIES[lib].records)
-        tlist = [r for r in recs if r.name in objlist]
+        objlist = frozenset(objlist)
         if categories is not None:
+            # restrict to the requested categories, keeping library record
+            # order so seeded choices are reproducible
             if not isinstance(categories, list):
                 categories = categories.split(',')
-            tlist = [r for r in tlist if r.wcategory in categories]
+            catset = frozenset(categories)
+            recs = []
+            for lib in libraries:
+                recs.extend(r for r in MODEL_LIBRARIES[lib].records
+                            if r.wcategory in catset)
+        else:
+            recs = []
+            for lib in libraries:
+                recs.extend(MODEL_LIBRARIES[lib].records)
+        tlist = [r for r in recs if r.name in objlist]
 
         if flex_only:
             tlist = [r for r in tlist if r.flex == True]
@@ -879,46 +919,42 @@ class Dominoes(RigidbodiesDataset):
                 print("applied %s at time step %d" % (self.push_cmd, frame))
             return [self.push_cmd]
         else:
-            return []
+            return EMPTY_COMMANDS
 
     def _write_static_data(self, static_group: h5py.Group) -> None:
         super()._write_static_data(static_group)
 
-        # randomization
-        try:
-            static_group.create_dataset("room", data=self.room)
-        except (AttributeError,TypeError):
-            pass
-        try:
-            static_group.create_dataset("seed", data=self.seed)
-        except (AttributeError,TypeError):
-            pass
-        try:
-            static_group.create_dataset("randomize", data=self.randomize)
-        except (AttributeError,TypeError):
-            pass
-        try:
-            static_group.create_dataset("trial_seed", data=self.trial_seed)
-        except (AttributeError,TypeError):
-            pass
-        try:
-            static_group.create_dataset("trial_num", data=self._trial_num)
-        except (AttributeError,TypeError):
-            pass
-
-        ## which objects are the zone, target, and probe
-        try:
-            static_group.create_dataset("zone_id", data=self.zone_id)
-        except (AttributeError,TypeError):
-            pass
-        try:
-            static_group.create_dataset("target_id", data=self.target_id)
-        except (AttributeError,TypeError):
-            pass
-        try:
-            static_group.create_dataset("probe_id", data=self.probe_id)
-        except (AttributeError,TypeError):
-            pass
+        # Trial-level metadata. Each dataset is written independently; anything
+        # missing for this scenario (AttributeError) or not h5-serializable
+        # (TypeError) is skipped, as with the old per-dataset try/excepts.
+        static_data = OrderedDict([
+            # randomization
+            ("room", lambda: self.room),
+            ("seed", lambda: self.seed),
+            ("randomize", lambda: self.randomize),
+            ("trial_seed", lambda: self.trial_seed),
+            ("trial_num", lambda: self._trial_num),
+            ## which objects are the zone, target, and probe
+            ("zone_id", lambda: self.zone_id),
+            ("target_id", lambda: self.target_id),
+            ("probe_id", lambda: self.probe_id),
+            ## color and scales of primitive objects
+            ("target_type", lambda: self.target_type),
+            ("target_rotation", lambda: xyz_to_arr(self.target_rotation)),
+            ("probe_type", lambda: self.probe_type),
+            ("probe_mass", lambda: self.probe_mass),
+            ("push_force", lambda: xyz_to_arr(self.push_force)),
+            ("push_position", lambda: xyz_to_arr(self.push_position)),
+            ("push_time", lambda: int(self.force_wait)),
+            # distractors and occluders
+            ("distractors", lambda: [r.name.encode('utf8') for r in self.distractors.values()]),
+            ("occluders", lambda: [r.name.encode('utf8') for r in self.occluders.values()]),
+        ])
+        for nm, get_data in static_data.items():
+            try:
+                static_group.create_dataset(nm, data=get_data())
+            except (AttributeError,TypeError):
+                pass
 
         if self.use_ramp:
             static_group.create_dataset("ramp_id", data=self.ramp_id)
@@ -926,46 +962,6 @@ class Dominoes(RigidbodiesDataset):
                 static_group.create_dataset("ramp_base_height", data=float(self.ramp_base_height))
                 static_group.create_dataset("ramp_base_id", data=self.ramp_base_id)
 
-        ## color and scales of primitive objects
-        try:
-            static_group.create_dataset("target_type", data=self.target_type)
-        except (AttributeError,TypeError):
-            pass
-        try:
-            static_group.create_dataset("target_rotation", data=xyz_to_arr(self.target_rotation))
-        except (AttributeError,TypeError):
-            pass
-        try:
-            static_group.create_dataset("probe_type", data=self.probe_type)
-        except (AttributeError,TypeError):
-            pass
-        try:
-            static_group.create_dataset("probe_mass", data=self.probe_mass)
-        except (AttributeError,TypeError):
-            pass
-        try:
-            static_group.create_dataset("push_force", data=xyz_to_arr(self.push_force))
-        except (AttributeError,TypeError):
-            pass
-        try:
-            static_group.create_dataset("push_position", data=xyz_to_arr(self.push_position))
-        except (AttributeError,TypeError):
-            pass
-        try:
-            static_group.create_dataset("push_time", data=int(self.force_wait))
-        except (AttributeError,TypeError):
-            pass
-
-        # distractors and occluders
-        try:
-            static_group.create_dataset("distractors", data=[r.name.encode('utf8') for r in self.distractors.values()])
-        except (AttributeError,TypeError):
-            pass
-        try:
-            static_group.create_dataset("occluders", data=[r.name.encode('utf8') for r in self.occluders.values()])
-        except (AttributeError,TypeError):
-            pass
-
     def _write_frame(self,
                      frames_grp: h5py.Group,
                      resp: List[bytes],
@@ -975,7 +971,7 @@ class Dominoes(RigidbodiesDataset):
                                                          resp=resp,
                                                          frame_num=frame_num)
         # If this is a stable structure, disregard whether anything is actually moving.
-        return frame, objs, tr, sleeping and not (frame_num < 150)
+        return frame, objs, tr, sleeping and not (frame_num < self.MIN_FRAMES)
 
     def _update_target_position(self, resp: List[bytes], frame_num: int) -> None:
         if frame_num <= 0:
@@ -1038,7 +1034,7 @@ class Dominoes(RigidbodiesDataset):
         return labels, resp, frame_num, done
 
     def is_done(self, resp: List[bytes], frame: int) -> bool:
-        return frame > 300
+        return frame > self.MAX_FRAMES
 
     def get_rotation(self, rot_range):
         if rot_range is None:
@@ -1456,7 +1452,11 @@ class Dominoes(RigidbodiesDataset):
             record, data = self.random_model(self.occluder_types, add_data=True)
             self.occluders[data['id']] = record
 
+    # records are long-lived librarian singletons, so their dimensions and
+    # aspect ratios can be cached per record instead of recomputed on every
+    # get_types filter and occluder/distractor placement
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_record_dimensions(record: ModelRecord) -> List[float]:
         length = np.abs(record.bounds['left']['x'] - record.bounds['right']['x'])
         height = np.abs(record.bounds['top']['y'] - record.bounds['bottom']['y'])
@@ -1464,6 +1464,7 @@ class Dominoes(RigidbodiesDataset):
         return (length, height, depth)
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def aspect_ratios(record: ModelRecord) -> List[float]:
         l,h,d = Dominoes.get_record_dimensions(record)
         a1 = float(h) / l
@@ -1973,15 +1974,10 @@ class MultiDominoes(Dominoes):
 
 
 if __name__ == "__main__":
-    import platform, os
 
     args = get_args("dominoes")
 
-    if platform.system() == 'Linux':
-        if args.gpu is not None:
-            os.environ["DISPLAY"] = ":0." + str(args.gpu)
-        else:
-            os.environ["DISPLAY"] = ":0"
+    set_gpu_display(args.gpu)
 
 
     DomC = MultiDominoes(
@@ -2020,8 +2016,8 @@ if __name__ == "__main__":
         middle_rotation_range=args.mrot,
         middle_mass_range=args.mmass,
         horizontal=args.horizontal,
-        remove_target=bool(args.remove_target),
-        remove_zone=bool(args.remove_zone),
+        remove_target=args.remove_target,
+        remove_zone=args.remove_zone,
         ## not scenario-specific
         camera_radius=args.camera_distance,
         camera_min_angle=args.camera_min_angle,
@@ -2044,7 +2040,7 @@ if __name__ == "__main__":
         occluder_aspect_ratio=args.occluder_aspect_ratio,
         distractor_aspect_ratio=args.distractor_aspect_ratio,
         remove_middle=args.remove_middle,
-        use_ramp=bool(args.ramp),
+        use_ramp=args.ramp,
         ramp_color=args.rcolor,
         flex_only=args.only_use_flex_objects,
         no_moving_distractors=args.no_moving_distractors,
@@ -2052,19 +2048,4 @@ if __name__ == "__main__":
         use_test_mode_colors=args.use_test_mode_colors
     )
 
-    if bool(args.run):
-        DomC.run(num=args.num,
-                 output_dir=args.dir,
-                 temp_path=args.temp,
-                 width=args.width,
-                 height=args.height,
-                 framerate=args.framerate,
-                 write_passes=args.write_passes.split(','),
-                 save_passes=args.save_passes.split(','),
-                 save_movies=args.save_movies,
-                 save_labels=args.save_labels,
-                 save_meshes=args.save_meshes,
-                 args_dict=vars(args))
-    else:
-        end = DomC.communicate({"$type": "terminate"})
-        print([OutputData.get_data_type_id(r) for r in end])
+    launch_controller(DomC, args)
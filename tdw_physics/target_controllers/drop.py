@@ -16,10 +16,11 @@ from tdw_physics.rigidbodies_dataset import (RigidbodiesDataset,
                                              get_random_xyz_transform,
                                              handle_random_transform_args,
                                              get_range)
-from tdw_physics.util import MODEL_LIBRARIES, get_parser, xyz_to_arr, arr_to_xyz
+from tdw_physics.dataset import EMPTY_COMMANDS
+from tdw_physics.util import MODEL_LIBRARIES, get_model_names, get_parser, xyz_to_arr, arr_to_xyz, launch_controller, set_gpu_display
 
 
-MODEL_NAMES = [r.name for r in MODEL_LIBRARIES['models_flex.json'].records]
+MODEL_NAMES = list(get_model_names('models_flex.json'))
 OCCLUDER_CATS = "coffee table,houseplant,vase,chair,dog,sofa,flowerpot,coffee maker,stool,laptop,laptop computer,globe,bookshelf,desktop computer,garden plant,garden plant,garden plant"
 DISTRACTOR_CATS = "coffee table,houseplant,vase,chair,dog,sofa,flowerpot,coffee maker,stool,laptop,laptop computer,globe,bookshelf,desktop computer,garden plant,garden plant,garden plant"
 
@@ -300,7 +301,7 @@ class Drop(MultiDominoes):
         return commands
 
     def get_per_frame_commands(self, resp: List[bytes], frame: int) -> List[dict]:
-        return []
+        return EMPTY_COMMANDS
 
     def _write_static_data(self, static_group: h5py.Group) -> None:
         super()._write_static_data(static_group)
@@ -321,10 +322,7 @@ class Drop(MultiDominoes):
                                                          resp=resp,
                                                          frame_num=frame_num)
         # If this is a stable structure, disregard whether anything is actually moving.
-        return frame, objs, tr, sleeping and frame_num < 300
-
-    def is_done(self, resp: List[bytes], frame: int) -> bool:
-        return frame > 300
+        return frame, objs, tr, sleeping and frame_num < self.MAX_FRAMES
 
     def get_rotation(self, rot_range):
         if rot_range is None:
@@ -523,12 +521,7 @@ if __name__ == "__main__":
 
     args = get_drop_args("drop")
 
-    import platform, os
-    if platform.system() == 'Linux':
-        if args.gpu is not None:
-            os.environ["DISPLAY"] = ":0." + str(args.gpu)
-        else:
-            os.environ["DISPLAY"] = ":0"
+    set_gpu_display(args.gpu)
 
 
     DC = Drop(
@@ -570,18 +563,4 @@ if __name__ == "__main__":
         use_test_mode_colors=args.use_test_mode_colors
     )
 
-    if bool(args.run):
-        DC.run(num=args.num,
-               output_dir=args.dir,
-               temp_path=args.temp,
-               width=args.width,
-               height=args.height,
-               write_passes=args.write_passes.split(','),
-                save_passes=args.save_passes.split(','),
-                save_movies=args.save_movies,
-                save_labels=args.save_labels,
-                save_meshes=args.save_meshes,
-                args_dict=vars(args))
-    else:
-        end = DC.communicate({"$type": "terminate"})
-        print([OutputData.get_data_type_id(r) for r in end])
+    launch_controller(DC, args)
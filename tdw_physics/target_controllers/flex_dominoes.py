@@ -421,8 +421,8 @@ if __name__ == '__main__':
         middle_rotation_range=args.mrot,
         middle_mass_range=args.mmass,
         horizontal=args.horizontal,
-        remove_target=bool(args.remove_target),
-        remove_zone=bool(args.remove_zone),
+        remove_target=args.remove_target,
+        remove_zone=args.remove_zone,
         ## not scenario-specific
         camera_radius=args.camera_distance,
         camera_min_angle=args.camera_min_angle,
@@ -442,20 +442,20 @@ if __name__ == '__main__':
         num_occluders=args.num_occluders,
         occlusion_scale=args.occlusion_scale,
         remove_middle=args.remove_middle,
-        use_ramp=bool(args.ramp),
+        use_ramp=args.ramp,
         ramp_color=args.rcolor,
         flex_only=args.only_use_flex_objects,
         no_moving_distractors=args.no_moving_distractors        
     )
 
-    if bool(args.run):
+    if args.run:
         C.run(num=args.num,
              output_dir=args.dir,
              temp_path=args.temp,
              width=args.width,
              height=args.height,
-             write_passes=args.write_passes.split(','),
-             save_passes=args.save_passes.split(','),
+             write_passes=args.write_passes,
+             save_passes=args.save_passes,
              save_movies=args.save_movies,
              save_labels=args.save_labels,
              args_dict=vars(args))
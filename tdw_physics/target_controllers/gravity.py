@@ -10,13 +10,15 @@ import random
 from typing import List, Dict, Tuple
 from weighted_collection import WeightedCollection
 from tdw.tdw_utils import TDWUtils
-from tdw.librarian import ModelRecord, MaterialLibrarian
+from tdw.librarian import ModelRecord
 from tdw.output_data import OutputData, Transforms
 from tdw_physics.rigidbodies_dataset import (RigidbodiesDataset,
                                              get_random_xyz_transform,
                                              get_range,
                                              handle_random_transform_args)
-from tdw_physics.util import (MODEL_LIBRARIES,
+from tdw_physics.util import (launch_controller, set_gpu_display,
+                              MATERIAL_TYPES, MATERIAL_NAMES,
+                              MODEL_LIBRARIES, get_model_names,
                               get_parser,
                               xyz_to_arr, arr_to_xyz, str_to_xyz,
                               none_or_str, none_or_int, int_or_bool)
@@ -24,11 +26,7 @@ from tdw_physics.util import (MODEL_LIBRARIES,
 from tdw_physics.target_controllers.dominoes import Dominoes, MultiDominoes, get_args
 from tdw_physics.postprocessing.labels import is_trial_valid
 
-MODEL_NAMES = [r.name for r in MODEL_LIBRARIES['models_flex.json'].records]
-M = MaterialLibrarian()
-MATERIAL_TYPES = M.get_material_types()
-MATERIAL_NAMES = {mtype: [m.name for m in M.get_all_materials_of_type(mtype)] \
-                  for mtype in MATERIAL_TYPES}
+MODEL_NAMES = list(get_model_names('models_flex.json'))
 
 def get_gravity_args(dataset_dir: str, parse=True):
 
@@ -360,6 +358,8 @@ class Pendulum(Gravity):
 if __name__ == '__main__':
 
     args = get_gravity_args("gravity")
+
+    set_gpu_display(args.gpu)
     
     classes = [Ramp, Pit, Pendulum]
     for c in classes:
@@ -403,8 +403,8 @@ if __name__ == '__main__':
         force_offset=args.foffset,
         force_offset_jitter=args.fjitter,
         force_wait=args.fwait,
-        remove_target=bool(args.remove_target),
-        remove_zone=bool(args.remove_zone),
+        remove_target=args.remove_target,
+        remove_zone=args.remove_zone,
         
         ## not scenario-specific
         room=args.room,
@@ -429,7 +429,7 @@ if __name__ == '__main__':
         num_occluders=args.num_occluders,
         occlusion_scale=args.occlusion_scale,
         remove_middle=args.remove_middle,
-        use_ramp=bool(args.ramp),
+        use_ramp=args.ramp,
         ramp_color=args.rcolor,
         ramp_material=args.rmaterial,
         flex_only=args.only_use_flex_objects,
@@ -437,17 +437,4 @@ if __name__ == '__main__':
     )
 
 
-    if bool(args.run):
-        GC.run(num=args.num,
-               output_dir=args.dir,
-               temp_path=args.temp,
-               width=args.width,
-               height=args.height,
-               write_passes=args.write_passes.split(','),               
-               save_passes=args.save_passes.split(','),
-               save_movies=args.save_movies,
-               save_labels=args.save_labels,               
-               args_dict=vars(args)
-        )
-    else:
-        GC.communicate({"$type": "terminate"})    
+    launch_controller(GC, args)
@@ -1,6 +1,7 @@
 from typing import List
 from tdw.tdw_utils import TDWUtils
 from tdw.librarian import ModelLibrarian
+from tdw_physics.dataset import EMPTY_COMMANDS
 from tdw_physics.rigidbodies_dataset import RigidbodiesDataset
 import sys
 
@@ -93,7 +94,7 @@ class Ramp(RigidbodiesDataset):
         return commands
 
     def get_per_frame_commands(self, resp: List[bytes], frame: int) -> List[dict]:
-        return []
+        return EMPTY_COMMANDS
 
     def is_done(self, resp: List[bytes], frame: int) -> bool:
         return frame > 500
@@ -9,22 +9,18 @@ import random
 from typing import List, Dict, Tuple
 from weighted_collection import WeightedCollection
 from tdw.tdw_utils import TDWUtils
-from tdw.librarian import ModelRecord, MaterialLibrarian
+from tdw.librarian import ModelRecord
 from tdw.output_data import OutputData, Transforms
 from tdw_physics.rigidbodies_dataset import (RigidbodiesDataset,
                                              get_random_xyz_transform,
                                              get_range,
                                              handle_random_transform_args)
-from tdw_physics.util import MODEL_LIBRARIES, get_parser, xyz_to_arr, arr_to_xyz, str_to_xyz
+from tdw_physics.util import MODEL_LIBRARIES, get_model_names, get_parser, xyz_to_arr, arr_to_xyz, str_to_xyz, launch_controller, set_gpu_display
 
 from tdw_physics.target_controllers.dominoes import Dominoes, MultiDominoes, get_args, none_or_str, none_or_int
 from tdw_physics.postprocessing.labels import is_trial_valid
 
-MODEL_NAMES = [r.name for r in MODEL_LIBRARIES['models_flex.json'].records]
-M = MaterialLibrarian()
-MATERIAL_TYPES = M.get_material_types()
-MATERIAL_NAMES = {mtype: [m.name for m in M.get_all_materials_of_type(mtype)] \
-                  for mtype in MATERIAL_TYPES}
+MODEL_NAMES = list(get_model_names('models_flex.json'))
 
 OCCLUDER_CATS = "coffee table,houseplant,vase,chair,dog,sofa,flowerpot,coffee maker,stool,laptop,laptop computer,globe,bookshelf,desktop computer,garden plant,garden plant,garden plant"
 DISTRACTOR_CATS = "coffee table,houseplant,vase,chair,dog,sofa,flowerpot,coffee maker,stool,laptop,laptop computer,globe,bookshelf,desktop computer,garden plant,garden plant,garden plant"
@@ -291,7 +287,8 @@ class RollingSliding(MultiDominoes):
         self.probe_mass = random.uniform(self.probe_mass_range[0], self.probe_mass_range[1])
         self.probe_initial_position = {"x": -0.5*self.collision_axis_length, "y": self.target_lift, "z": 0.}
         rot = self.get_rotation(self.target_rotation_range)
-        print(rot)
+        if self.PRINT:
+            print(rot)
 
         if self.use_ramp:
             commands.extend(self._place_ramp_under_probe())
@@ -390,7 +387,8 @@ class RollingSliding(MultiDominoes):
 
         # decide when to apply the force
         self.force_wait = int(random.uniform(*get_range(self.force_wait_range)))
-        print("force wait", self.force_wait)
+        if self.PRINT:
+            print("force wait", self.force_wait)
 
         if self.force_wait == 0:
             commands.append(self.push_cmd)
@@ -543,8 +541,9 @@ class RollingSliding(MultiDominoes):
             {"$type": "set_color",
              "color": {"r": rgb[0], "g": rgb[1], "b": rgb[2], "a": 1.},
              "id": ramp_id})
-        print("ramp commands")
-        print(cmds)
+        if self.PRINT:
+            print("ramp commands")
+            print(cmds)
 
         # need to adjust probe height as a result of ramp placement
         self.probe_initial_position['x'] -= 0.5 * self.ramp_scale['x'] * r_len - 0.15
@@ -635,15 +634,10 @@ class RollingSliding(MultiDominoes):
 
 
 if __name__ == "__main__":
-    import platform, os
 
     args = get_rolling_sliding_args("rolling_sliding")
 
-    if platform.system() == 'Linux':
-        if args.gpu is not None:
-            os.environ["DISPLAY"] = ":0." + str(args.gpu)
-        else:
-            os.environ["DISPLAY"] = ":0"
+    set_gpu_display(args.gpu)
 
     ColC = RollingSliding(
         room=args.room,
@@ -670,8 +664,8 @@ if __name__ == "__main__":
         force_offset=args.foffset,
         force_offset_jitter=args.fjitter,
         force_wait=args.fwait,
-        remove_target=bool(args.remove_target),
-        remove_zone=bool(args.remove_zone),
+        remove_target=args.remove_target,
+        remove_zone=args.remove_zone,
         zjitter = args.zjitter,
         fupforce = args.fupforce,
         use_ramp = args.ramp,
@@ -704,18 +698,4 @@ if __name__ == "__main__":
         use_test_mode_colors=args.use_test_mode_colors        
     )
 
-    if bool(args.run):
-        ColC.run(num=args.num,
-               output_dir=args.dir,
-               temp_path=args.temp,
-               width=args.width,
-               height=args.height,
-               save_passes=args.save_passes.split(','),
-               save_movies=args.save_movies,
-               save_labels=args.save_labels,
-               save_meshes=args.save_meshes,
-               write_passes=args.write_passes,
-               args_dict=vars(args)
-        )
-    else:
-        ColC.communicate({"$type": "terminate"})
+    launch_controller(ColC, args)
@@ -10,13 +10,15 @@ import random
 from typing import List, Dict, Tuple
 from weighted_collection import WeightedCollection
 from tdw.tdw_utils import TDWUtils
-from tdw.librarian import ModelRecord, MaterialLibrarian
+from tdw.librarian import ModelRecord
 from tdw.output_data import OutputData, Transforms
 from tdw_physics.rigidbodies_dataset import (RigidbodiesDataset,
                                              get_random_xyz_transform,
                                              get_range,
                                              handle_random_transform_args)
-from tdw_physics.util import (MODEL_LIBRARIES,
+from tdw_physics.util import (launch_controller, set_gpu_display,
+                              MATERIAL_TYPES, MATERIAL_NAMES,
+                              MODEL_LIBRARIES, get_model_names,
                               get_parser,
                               xyz_to_arr, arr_to_xyz, str_to_xyz,
                               none_or_str, none_or_int, int_or_bool)
@@ -24,11 +26,7 @@ from tdw_physics.util import (MODEL_LIBRARIES,
 from tdw_physics.target_controllers.dominoes import Dominoes, MultiDominoes, get_args
 from tdw_physics.postprocessing.labels import is_trial_valid
 
-MODEL_NAMES = [r.name for r in MODEL_LIBRARIES['models_flex.json'].records]
-M = MaterialLibrarian()
-MATERIAL_TYPES = M.get_material_types()
-MATERIAL_NAMES = {mtype: [m.name for m in M.get_all_materials_of_type(mtype)] \
-                  for mtype in MATERIAL_TYPES}
+MODEL_NAMES = list(get_model_names('models_flex.json'))
 
 '''
 The tower controller generats stims in which the target object is
@@ -200,6 +198,7 @@ class Tower(MultiDominoes):
 
     STANDARD_BLOCK_SCALE = {"x": 0.5, "y": 0.5, "z": 0.5}
     STANDARD_MASS_FACTOR = 1.0 # cubes
+    MAX_FRAMES = 600
 
     def __init__(self,
                  port: int = None,
@@ -320,7 +319,8 @@ class Tower(MultiDominoes):
         return cmds
 
     def _build_intermediate_structure(self) -> List[dict]:
-        print("middle color", self.middle_color)
+        if self.PRINT:
+            print("middle color", self.middle_color)
         if self.randomize_colors_across_trials:
             self.middle_color = self.random_color(exclude=self.target_color) if self.monochrome else None
         self.cap_color = self.target_color
@@ -341,7 +341,8 @@ class Tower(MultiDominoes):
         return {"x": jx, "y": y, "z": jz}
 
     def _get_block_scale(self, offset) -> dict:
-        print("scale range", self.middle_scale_range)
+        if self.PRINT:
+            print("scale range", self.middle_scale_range)
         scale = get_random_xyz_transform(self.middle_scale_range)
         scale = {k:v+offset for k,v in scale.items()}
 
@@ -401,14 +402,16 @@ class Tower(MultiDominoes):
                  "scale_factor": scale,
                  "id": o_id}])
 
-            print("placed middle object %s" % str(m+1))
+            if self.PRINT:
+                print("placed middle object %s" % str(m+1))
 
             # update height
             _y = record.bounds['top']['y'] if self.middle_type != 'bowl' else (record.bounds['bottom']['y'] + 0.1)
             height += scale["y"] * _y
 
             data.update({'position': block_pos, 'rotation': block_rot, 'mass': block_mass})
-            print("middle object data", data)
+            if self.PRINT:
+                print("middle object data", data)
             self.blocks.append((record, data))
             self.tower_height = height
 
@@ -475,20 +478,11 @@ class Tower(MultiDominoes):
 
         return commands
 
-    def is_done(self, resp: List[bytes], frame: int) -> bool:
-        return frame > 600
-        # return (frame > 750) or (self.fall_frame is not None and ((frame - 60) > self.fall_frame))
-
 if __name__ == "__main__":
 
     args = get_tower_args("towers")
 
-    import platform
-    if platform.system() == 'Linux':
-        if args.gpu is not None:
-            os.environ["DISPLAY"] = ":0." + str(args.gpu)
-        else:
-            os.environ["DISPLAY"] = ":0"
+    set_gpu_display(args.gpu)
 
     TC = Tower(
         port=args.port,
@@ -522,8 +516,8 @@ if __name__ == "__main__":
         force_offset=args.foffset,
         force_offset_jitter=args.fjitter,
         force_wait=args.fwait,
-        remove_target=bool(args.remove_target),
-        remove_zone=bool(args.remove_zone),
+        remove_target=args.remove_target,
+        remove_zone=args.remove_zone,
         ## not scenario-specific
         room=args.room,
         randomize=args.random,
@@ -547,7 +541,7 @@ if __name__ == "__main__":
         num_occluders=args.num_occluders,
         occlusion_scale=args.occlusion_scale,
         remove_middle=args.remove_middle,
-        use_ramp=bool(args.ramp),
+        use_ramp=args.ramp,
         ramp_color=args.rcolor,
         ramp_base_height_range=args.rheight,
         flex_only=args.only_use_flex_objects,
@@ -555,19 +549,4 @@ if __name__ == "__main__":
         use_test_mode_colors=args.use_test_mode_colors
     )
 
-    if bool(args.run):
-        TC.run(num=args.num,
-               output_dir=args.dir,
-               temp_path=args.temp,
-               width=args.width,
-               height=args.height,
-               framerate=args.framerate,
-               write_passes=args.write_passes.split(','),
-               save_passes=args.save_passes.split(','),
-               save_movies=args.save_movies,
-               save_labels=args.save_labels,
-               save_meshes=args.save_meshes,
-               args_dict=vars(args)
-        )
-    else:
-        TC.communicate({"$type": "terminate"})
+    launch_controller(TC, args)
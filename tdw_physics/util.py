@@ -1,8 +1,12 @@
-from typing import Dict, List
+import os
+import platform
+from typing import Dict, List, Optional, Tuple
+import functools
 import random
 import numpy as np
 from tdw.librarian import ModelLibrarian, MaterialLibrarian
 from tdw.tdw_utils import TDWUtils
+from tdw.output_data import OutputData
 import argparse
 
 # Every model library, sorted by name.
@@ -16,18 +20,42 @@ for filename in MODEL_LIBRARIES.keys():
     FLEX_MODELS[filename] = {
         record for record in MODEL_LIBRARIES[filename].records if record.flex == True}
 
+@functools.lru_cache(maxsize=None)
+def get_model_names(library: str, exclude_do_not_use: bool = False) -> Tuple[str]:
+    """
+    :param library: The model library filename.
+    :param exclude_do_not_use: Whether to drop records flagged do_not_use.
+
+    :return: The names of all the models in the library; walked once per process and cached.
+    """
+    records = MODEL_LIBRARIES[library].records
+    if exclude_do_not_use:
+        records = [r for r in records if not r.do_not_use]
+    return tuple(r.name for r in records)
+
+@functools.lru_cache(maxsize=None)
+def get_model_categories(library: str = "models_full.json") -> Tuple[str]:
+    """
+    :return: The unique wcategories of all the models in the library; cached per process.
+    """
+    return tuple({r.wcategory for r in MODEL_LIBRARIES[library].records})
+
+@functools.lru_cache(maxsize=None)
+def get_material_names() -> Dict[str, List[str]]:
+    """
+    :return: A dict of material type -> material names; built once per process and cached.
+    """
+    M = MaterialLibrarian()
+    return {mtype: [m.name for m in M.get_all_materials_of_type(mtype)] \
+            for mtype in M.get_material_types()}
+
 # All the model categories
-MODEL_CATEGORIES = []
-for record in MODEL_LIBRARIES["models_full.json"].records:
-    MODEL_CATEGORIES.append(record.wcategory)
-MODEL_CATEGORIES = list(set(MODEL_CATEGORIES))
+MODEL_CATEGORIES = list(get_model_categories())
 
 # All the material types and materials
-M = MaterialLibrarian()
-MATERIAL_TYPES = M.get_material_types()
-MATERIAL_NAMES = {mtype: [m.name for m in M.get_all_materials_of_type(mtype)] \
-                  for mtype in MATERIAL_TYPES}        
-    
+MATERIAL_NAMES = get_material_names()
+MATERIAL_TYPES = list(MATERIAL_NAMES.keys())
+
 
 # The names of the image passes
 PASSES = ["_img", "_depth", "_normals", "_flow", "_id"]    
@@ -154,6 +182,38 @@ def get_args(dataset_dir: str):
     parser = get_parser(dataset_dir, get_help=True)
     return parser.parse_args()
 
+def set_gpu_display(gpu: Optional[int]) -> None:
+    """
+    Point the TDW build at the X display for the requested gpu (Linux only).
+    """
+    if platform.system() == 'Linux':
+        if gpu is not None:
+            os.environ["DISPLAY"] = ":0." + str(gpu)
+        else:
+            os.environ["DISPLAY"] = ":0"
+
+def launch_controller(controller, args) -> None:
+    """
+    Run a dataset controller with the parsed common command-line args, or
+    just terminate the build if called with --run 0.
+    """
+    if args.run:
+        controller.run(num=args.num,
+                       output_dir=args.dir,
+                       temp_path=args.temp,
+                       width=args.width,
+                       height=args.height,
+                       framerate=args.framerate,
+                       write_passes=args.write_passes,
+                       save_passes=args.save_passes,
+                       save_movies=args.save_movies,
+                       save_labels=args.save_labels,
+                       save_meshes=args.save_meshes,
+                       args_dict=vars(args))
+    else:
+        end = controller.communicate({"$type": "terminate"})
+        print([OutputData.get_data_type_id(r) for r in end])
+
 if __name__ == '__main__':
 
     parser = argparse.ArgumentParser(add_help=True)